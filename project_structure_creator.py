@@ -5,292 +5,12 @@ Creates the complete directory structure and empty files for the MLOps project.
 """
 
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def create_mlops_project_structure(project_name="House-Credit-Fraud"):
-    """
-    Creates the complete MLOps project directory structure with empty files.
-    
-    Args:
-        project_name (str): Name of the project directory
-    """
-    
-    # Define the project structure
-    structure = {
-        # Root files
-        "": [
-            "README.md",
-            "requirements.txt", 
-            "setup.py",
-            ".env.example",
-            ".gitignore",
-            ".dvcignore",
-            "dvc.yaml",
-            "params.yaml",
-            "mlproject",
-            "docker-compose.yml",
-            "Dockerfile"
-        ],
-        
-        # Config directory
-        "config": [
-            "__init__.py",
-            "app_config.yaml",
-            "database_config.yaml", 
-            "spark_config.yaml",
-            "mlflow_config.yaml",
-            "evidently_config.yaml"
-        ],
-        
-        # Source code structure
-        "src": ["__init__.py"],
-        
-        # Entities
-        "src/entities": [
-            "__init__.py",
-            "base_entity.py",
-            "dataset_entity.py",
-            "feature_entity.py",
-            "model_entity.py",
-            "experiment_entity.py",
-            "prediction_entity.py",
-            "report_entity.py",
-            "pipeline_entity.py"
-        ],
-        
-        # Repositories
-        "src/repositories": [
-            "__init__.py",
-            "base_repository.py",
-            "mysql_repository.py",
-            "mlflow_repository.py",
-            "feature_repository.py",
-            "dvc_repository.py",
-            "evidently_repository.py"
-        ],
-        
-        # Services
-        "src/services": [
-            "__init__.py",
-            "data_service.py",
-            "feature_service.py",
-            "training_service.py",
-            "inference_service.py",
-            "evaluation_service.py",
-            "monitoring_service.py",
-            "pipeline_service.py"
-        ],
-        
-        # Factories
-        "src/factories": [
-            "__init__.py",
-            "spark_factory.py",
-            "model_factory.py",
-            "feature_factory.py",
-            "repository_factory.py",
-            "service_factory.py"
-        ],
-        
-        # Processors
-        "src/processors": [
-            "__init__.py",
-            "data_processor.py",
-            "feature_processor.py",
-            "model_processor.py",
-            "report_processor.py"
-        ],
-        
-        # Utils
-        "src/utils": [
-            "__init__.py",
-            "config_manager.py",
-            "logger.py",
-            "validator.py",
-            "exceptions.py",
-            "decorators.py"
-        ],
-        
-        # Tests structure
-        "tests": [
-            "__init__.py",
-            "conftest.py"
-        ],
-        
-        "tests/unit": ["__init__.py"],
-        "tests/unit/entities": ["__init__.py"],
-        "tests/unit/repositories": ["__init__.py"],
-        "tests/unit/services": ["__init__.py"],
-        "tests/unit/processors": ["__init__.py"],
-        
-        "tests/integration": [
-            "__init__.py",
-            "test_database_integration.py",
-            "test_mlflow_integration.py",
-            "test_pipeline_integration.py"
-        ],
-        
-        "tests/fixtures": ["__init__.py"],
-        "tests/fixtures/sample_datasets": [],
-        "tests/fixtures/mock_configs": [],
-        
-        # Notebooks
-        "notebooks": [
-            "01_data_exploration.ipynb",
-            "02_feature_analysis.ipynb",
-            "03_model_experimentation.ipynb",
-            "04_monitoring_analysis.ipynb"
-        ],
-        
-        # Data directories (DVC tracked)
-        "data": [],
-        "data/raw": [],
-        "data/processed": [],
-        "data/features": [],
-        "data/predictions": [],
-        
-        # Models directory (DVC tracked)
-        "models": [],
-        "models/experiments": [],
-        "models/production": [],
-        "models/staging": [],
-        
-        # Reports directory (DVC tracked)
-        "reports": [],
-        "reports/data_validation": [],
-        "reports/model_evaluation": [],
-        "reports/drift_detection": [],
-        "reports/performance_monitoring": [],
-        
-        # Pipelines
-        "pipelines": [
-            "__init__.py",
-            "training_pipeline.py",
-            "inference_pipeline.py",
-            "monitoring_pipeline.py",
-            "data_pipeline.py"
-        ],
-        
-        # API structure
-        "api": [
-            "__init__.py",
-            "app.py"
-        ],
-        
-        "api/routes": [
-            "__init__.py",
-            "prediction_routes.py",
-            "model_routes.py",
-            "monitoring_routes.py"
-        ],
-        
-        "api/middleware": [
-            "__init__.py",
-            "auth_middleware.py",
-            "logging_middleware.py"
-        ],
-        
-        # Deployment structure
-        "deployment": [],
-        
-        "deployment/docker": [
-            "training.Dockerfile",
-            "serving.Dockerfile",
-            "monitoring.Dockerfile"
-        ],
-        
-        "deployment/kubernetes": [
-            "training-job.yaml",
-            "serving-deployment.yaml",
-            "monitoring-deployment.yaml"
-        ],
-        
-        "deployment/terraform": [
-            "main.tf",
-            "variables.tf",
-            "outputs.tf"
-        ],
-        
-        "deployment/scripts": [
-            "deploy_model.sh",
-            "setup_infrastructure.sh",
-            "rollback_model.sh"
-        ],
-        
-        # Monitoring structure
-        "monitoring": ["__init__.py"],
-        
-        "monitoring/dashboards": [
-            "grafana_dashboard.json",
-            "mlflow_dashboard.py"
-        ],
-        
-        "monitoring/alerts": [
-            "drift_alerts.yaml",
-            "performance_alerts.yaml"
-        ],
-        
-        "monitoring/schedulers": [
-            "__init__.py",
-            "monitoring_scheduler.py",
-            "retraining_scheduler.py"
-        ],
-        
-        # Scripts
-        "scripts": [
-            "setup_environment.sh",
-            "initialize_project.py",
-            "run_training.py",
-            "run_inference.py",
-            "run_monitoring.py",
-            "data_migration.py",
-            "model_deployment.py"
-        ]
-    }
-    
-    # Create project root directory
-    project_path = Path(project_name)
-    project_path.mkdir(exist_ok=True)
-    
-    print(f"Creating MLOps project structure in: {project_path.absolute()}")
-    
-    # Create directories and files
-    for directory, files in structure.items():
-        if directory:
-            dir_path = project_path / directory
-            dir_path.mkdir(parents=True, exist_ok=True)
-            print(f"Created directory: {dir_path}")
-        else:
-            dir_path = project_path
-        
-        # Create empty files
-        for file in files:
-            file_path = dir_path / file
-            file_path.touch()
-            print(f"Created file: {file_path}")
-    
-    print(f"\n✅ MLOps project structure created successfully!")
-    print(f"📁 Project location: {project_path.absolute()}")
-    print(f"📊 Total directories created: {len([d for d in structure.keys() if d])}")
-    print(f"📄 Total files created: {sum(len(files) for files in structure.values())}")
-    
-    # Create additional empty directories that might be needed
-    additional_dirs = [
-        "logs",
-        "temp",
-        ".dvc",
-        "mlruns"
-    ]
-    
-    for dir_name in additional_dirs:
-        additional_path = project_path / dir_name
-        additional_path.mkdir(exist_ok=True)
-        print(f"Created additional directory: {additional_path}")
-    
-    return project_path
-
-def create_gitignore_content(project_path):
-    """Create a comprehensive .gitignore file for the MLOps project."""
-    gitignore_content = """# Python
+# Contents written by create_gitignore_content
+GITIGNORE_BYTES = b"""# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -384,10 +104,366 @@ spark-warehouse/
 derby.log
 metastore_db/
 """
+
+# Project layout: (directory relative to the project root, files it contains)
+_STRUCTURE = (
+    # Root files
+    ("", (
+        "README.md",
+        "requirements.txt",
+        "setup.py",
+        ".env.example",
+        ".gitignore",
+        ".dvcignore",
+        "dvc.yaml",
+        "params.yaml",
+        "mlproject",
+        "docker-compose.yml",
+        "Dockerfile",
+    )),
+    
+    # Config directory
+    ("config", (
+        "__init__.py",
+        "app_config.yaml",
+        "database_config.yaml",
+        "spark_config.yaml",
+        "mlflow_config.yaml",
+        "evidently_config.yaml",
+    )),
+    
+    # Source code structure
+    ("src", ("__init__.py",)),
+    
+    # Entities
+    ("src/entities", (
+        "__init__.py",
+        "base_entity.py",
+        "dataset_entity.py",
+        "feature_entity.py",
+        "model_entity.py",
+        "experiment_entity.py",
+        "prediction_entity.py",
+        "report_entity.py",
+        "pipeline_entity.py",
+    )),
+    
+    # Repositories
+    ("src/repositories", (
+        "__init__.py",
+        "base_repository.py",
+        "mysql_repository.py",
+        "mlflow_repository.py",
+        "feature_repository.py",
+        "dvc_repository.py",
+        "evidently_repository.py",
+    )),
+    
+    # Services
+    ("src/services", (
+        "__init__.py",
+        "data_service.py",
+        "feature_service.py",
+        "training_service.py",
+        "inference_service.py",
+        "evaluation_service.py",
+        "monitoring_service.py",
+        "pipeline_service.py",
+    )),
+    
+    # Factories
+    ("src/factories", (
+        "__init__.py",
+        "spark_factory.py",
+        "model_factory.py",
+        "feature_factory.py",
+        "repository_factory.py",
+        "service_factory.py",
+    )),
+    
+    # Processors
+    ("src/processors", (
+        "__init__.py",
+        "data_processor.py",
+        "feature_processor.py",
+        "model_processor.py",
+        "report_processor.py",
+    )),
+    
+    # Utils
+    ("src/utils", (
+        "__init__.py",
+        "config_manager.py",
+        "logger.py",
+        "validator.py",
+        "exceptions.py",
+        "decorators.py",
+    )),
+    
+    # Tests structure
+    ("tests", (
+        "__init__.py",
+        "conftest.py",
+    )),
+    
+    ("tests/unit", ("__init__.py",)),
+    ("tests/unit/entities", ("__init__.py",)),
+    ("tests/unit/repositories", ("__init__.py",)),
+    ("tests/unit/services", ("__init__.py",)),
+    ("tests/unit/processors", ("__init__.py",)),
+    
+    ("tests/integration", (
+        "__init__.py",
+        "test_database_integration.py",
+        "test_mlflow_integration.py",
+        "test_pipeline_integration.py",
+    )),
     
-    gitignore_path = project_path / ".gitignore"
-    with open(gitignore_path, 'w') as f:
-        f.write(gitignore_content)
+    ("tests/fixtures", ("__init__.py",)),
+    ("tests/fixtures/sample_datasets", ()),
+    ("tests/fixtures/mock_configs", ()),
+    
+    # Notebooks
+    ("notebooks", (
+        "01_data_exploration.ipynb",
+        "02_feature_analysis.ipynb",
+        "03_model_experimentation.ipynb",
+        "04_monitoring_analysis.ipynb",
+    )),
+    
+    # Data directories (DVC tracked)
+    ("data", ()),
+    ("data/raw", ()),
+    ("data/processed", ()),
+    ("data/features", ()),
+    ("data/predictions", ()),
+    
+    # Models directory (DVC tracked)
+    ("models", ()),
+    ("models/experiments", ()),
+    ("models/production", ()),
+    ("models/staging", ()),
+    
+    # Reports directory (DVC tracked)
+    ("reports", ()),
+    ("reports/data_validation", ()),
+    ("reports/model_evaluation", ()),
+    ("reports/drift_detection", ()),
+    ("reports/performance_monitoring", ()),
+    
+    # Pipelines
+    ("pipelines", (
+        "__init__.py",
+        "training_pipeline.py",
+        "inference_pipeline.py",
+        "monitoring_pipeline.py",
+        "data_pipeline.py",
+    )),
+    
+    # API structure
+    ("api", (
+        "__init__.py",
+        "app.py",
+    )),
+    
+    ("api/routes", (
+        "__init__.py",
+        "prediction_routes.py",
+        "model_routes.py",
+        "monitoring_routes.py",
+    )),
+    
+    ("api/middleware", (
+        "__init__.py",
+        "auth_middleware.py",
+        "logging_middleware.py",
+    )),
+    
+    # Deployment structure
+    ("deployment", ()),
+    
+    ("deployment/docker", (
+        "training.Dockerfile",
+        "serving.Dockerfile",
+        "monitoring.Dockerfile",
+    )),
+    
+    ("deployment/kubernetes", (
+        "training-job.yaml",
+        "serving-deployment.yaml",
+        "monitoring-deployment.yaml",
+    )),
+    
+    ("deployment/terraform", (
+        "main.tf",
+        "variables.tf",
+        "outputs.tf",
+    )),
+    
+    ("deployment/scripts", (
+        "deploy_model.sh",
+        "setup_infrastructure.sh",
+        "rollback_model.sh",
+    )),
+    
+    # Monitoring structure
+    ("monitoring", ("__init__.py",)),
+    
+    ("monitoring/dashboards", (
+        "grafana_dashboard.json",
+        "mlflow_dashboard.py",
+    )),
+    
+    ("monitoring/alerts", (
+        "drift_alerts.yaml",
+        "performance_alerts.yaml",
+    )),
+    
+    ("monitoring/schedulers", (
+        "__init__.py",
+        "monitoring_scheduler.py",
+        "retraining_scheduler.py",
+    )),
+    
+    # Scripts
+    ("scripts", (
+        "setup_environment.sh",
+        "initialize_project.py",
+        "run_training.py",
+        "run_inference.py",
+        "run_monitoring.py",
+        "data_migration.py",
+        "model_deployment.py",
+    )),
+)
+
+# Same entries sorted by depth, then name, so parents always precede children,
+# with directories converted to the platform's separator
+_STRUCTURE_BY_DEPTH = tuple(
+    (directory.replace("/", os.sep), files)
+    for directory, files in sorted(_STRUCTURE, key=lambda entry: (entry[0].count("/"), entry[0]))
+)
+
+_TOTAL_DIRS = sum(1 for directory, _ in _STRUCTURE if directory)
+_TOTAL_FILES = sum(len(files) for _, files in _STRUCTURE)
+
+def _make_dirs(dir_path, seen):
+    """
+    Create dir_path and any missing ancestors, skipping directories in seen.
+    
+    Args:
+        dir_path (str): Directory to create
+        seen (set): Directories already created during this run; updated in place
+    """
+    missing = []
+    path = dir_path
+    while path not in seen:
+        missing.append(path)
+        parent = os.path.dirname(path)
+        if not parent or parent == path:
+            break
+        path = parent
+    
+    for path in reversed(missing):
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            if not os.path.isdir(path):
+                raise
+        seen.add(path)
+
+def _touch(file_path):
+    """
+    Create an empty file if it does not exist, without Path.touch()'s extra stat.
+    
+    Args:
+        file_path (str): Path of the file to create
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | getattr(os, "O_CLOEXEC", 0), 0o644)
+    os.close(fd)
+
+def create_mlops_project_structure(project_name="House-Credit-Fraud", quiet=False, workers=1):
+    """
+    Creates the complete MLOps project directory structure with empty files.
+    
+    Args:
+        project_name (str): Name of the project directory
+        quiet (bool): Skip the per-directory and per-file progress messages
+        workers (int): Threads used to create files; only worth raising on
+            network filesystems, where each create is a round-trip
+    """
+    
+    # Create project root directory
+    project_path = Path(project_name)
+    project_path.mkdir(exist_ok=True)
+    
+    # Progress messages are collected and written to stdout in a single call,
+    # from a finally block so a failed run still shows how far it got
+    log_lines = [f"Creating MLOps project structure in: {project_path.absolute()}"]
+    
+    try:
+        # Phase 1: create directories serially. Iterating in depth order guarantees every
+        # parent is created (and in seen) before its children, so each directory
+        # costs a single os.mkdir with no walk over its ancestors.
+        # Paths are built as plain strings; Path is only kept for project_path
+        base = str(project_path)
+        seen = {base}
+        file_paths = []
+        for directory, files in _STRUCTURE_BY_DEPTH:
+            if directory:
+                dir_path = base + os.sep + directory
+                _make_dirs(dir_path, seen)
+                if not quiet:
+                    log_lines.append(f"Created directory: {dir_path}")
+            else:
+                dir_path = base
+        
+            for file in files:
+                file_paths.append(dir_path + os.sep + file)
+        
+        # Phase 2: create empty files now that every parent exists
+        if workers > 1 and file_paths:
+            with ThreadPoolExecutor(max_workers=min(workers, len(file_paths))) as executor:
+                list(executor.map(_touch, file_paths))
+        else:
+            for file_path in file_paths:
+                _touch(file_path)
+        
+        if not quiet:
+            log_lines.extend(f"Created file: {file_path}" for file_path in file_paths)
+        
+        log_lines.append(f"\n✅ MLOps project structure created successfully!")
+        log_lines.append(f"📁 Project location: {project_path.absolute()}")
+        log_lines.append(f"📊 Total directories created: {_TOTAL_DIRS}")
+        log_lines.append(f"📄 Total files created: {_TOTAL_FILES}")
+        
+        # Create additional empty directories that might be needed
+        additional_dirs = [
+            "logs",
+            "temp",
+            ".dvc",
+            "mlruns"
+        ]
+        
+        # One scandir of the project root replaces a stat per directory. Names that
+        # exist but are not directories still go to os.mkdir, which raises
+        # FileExistsError just like mkdir(exist_ok=True) did.
+        with os.scandir(base) as entries:
+            existing_dirs = {entry.name for entry in entries if entry.is_dir()}
+        for dir_name in additional_dirs:
+            additional_path = base + os.sep + dir_name
+            if dir_name not in existing_dirs:
+                os.mkdir(additional_path)
+            if not quiet:
+                log_lines.append(f"Created additional directory: {additional_path}")
+    finally:
+        sys.stdout.write("\n".join(log_lines) + "\n")
+    
+    return project_path
+
+def create_gitignore_content(project_path):
+    """Create a comprehensive .gitignore file for the MLOps project."""
+    (project_path / ".gitignore").write_bytes(GITIGNORE_BYTES)
     
     print(f"Updated .gitignore with comprehensive rules")
 
@@ -406,11 +482,22 @@ def main():
         action="store_true",
         help="Create comprehensive .gitignore file"
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print the summary, not every created directory and file"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Threads used to create files, useful on network filesystems (default: 1)"
+    )
     
     args = parser.parse_args()
     
     # Create project structure
-    project_path = create_mlops_project_structure(args.project_name)
+    project_path = create_mlops_project_structure(args.project_name, quiet=args.quiet, workers=args.workers)
     
     # Create .gitignore if requested
     if args.create_gitignore:
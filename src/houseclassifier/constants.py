@@ -1,8 +1,11 @@
 # constants.py
 from pathlib import Path
 
+__all__ = ("PROJECT_ROOT", "CONFIG_DIR", "DATA_DIR")
+
 PROJECT_ROOT = Path(__file__).parent.parent
 CONFIG_DIR = PROJECT_ROOT / "configs"
 DATA_DIR = PROJECT_ROOT / "data"
 
-print(CONFIG_DIR, DATA_DIR)
\ No newline at end of file
+if __name__ == "__main__":
+    print(CONFIG_DIR, DATA_DIR)
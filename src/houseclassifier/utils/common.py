@@ -1,11 +1,31 @@
+import copy
+import os
+from functools import lru_cache
+
 import yaml
 from houseclassifier.utils.logger import src_logger
 
-def read_yaml(file) -> dict:
-        with open(file) as stream:
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+@lru_cache(maxsize=64)
+def _read_yaml_cached(path: str, mtime_ns: int, size: int):
+        # mtime_ns and size are part of the cache key so edited files are re-read,
+        # even on filesystems with coarse timestamps
+        # Binary mode: libyaml detects the encoding and decodes internally
+        with open(path, 'rb') as stream:
             try:
-                y = yaml.safe_load(stream)
-                src_logger.info(f"{file} has been successfully loaded.")
-                return y
+                y = yaml.load(stream, Loader=_Loader)
             except Exception as e:
-                raise e
\ No newline at end of file
+                raise e
+        return y
+
+def read_yaml(file) -> dict:
+        path = os.path.abspath(os.fspath(file))
+        st = os.stat(path)
+        # The cached object is shared, so each caller gets its own copy to mutate
+        y = copy.deepcopy(_read_yaml_cached(path, st.st_mtime_ns, st.st_size))
+        src_logger.info(f"{file} has been successfully loaded.")
+        return y
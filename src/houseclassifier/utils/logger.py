@@ -1,17 +1,23 @@
 import logging
+import logging.handlers
 
 src_logger = logging.getLogger('SRC_Logger')
 src_logger.setLevel(logging.DEBUG)
 
-fh = logging.FileHandler(filename = 'running_logs.log', mode = 'a')
-fh.setlevel(logging.DEBUG)
+if not src_logger.handlers:
+    # Open the log file lazily and buffer records so INFO/DEBUG lines are
+    # written in batches; WARNING and above flush the buffer immediately, and
+    # logging.shutdown flushes whatever is left at interpreter exit.
+    fh = logging.FileHandler(filename = 'running_logs.log', mode = 'a', delay = True)
+    fh.setLevel(logging.DEBUG)
+    mh = logging.handlers.MemoryHandler(capacity = 1024, flushLevel = logging.WARNING, target = fh)
 
-ch = logging.StreamHandler()
-ch.setLevel(logging.INFO)
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.INFO)
 
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-fh.setFormatter(formatter)
-ch.setFormatter(formatter)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    fh.setFormatter(formatter)
+    ch.setFormatter(formatter)
 
-src_logger.addHandler(fh)
-src_logger.addHandler(ch)
+    src_logger.addHandler(mh)
+    src_logger.addHandler(ch)